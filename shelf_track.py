@@ -1,825 +1,1093 @@
-"""
-Book and Author Management System
-
-This program manages a book inventory and author database using SQLite.
-Users can:
-- Add new books or authors (with ID validation)
-- Update book details (quantity, title, or author ID)
-- Delete books or authors (with checks for related records)
-- Search for books and view all book records
-
-The system ensures that author IDs in books match existing authors and
-prevents accidental data loss.
-"""
-import sqlite3
-
-DB_NAME = "ebookstore.db"
-
-
-def connect_db() -> sqlite3.Connection:
-    """
-    Establishes and returns a connection to the SQLite database.
-
-    Returns:
-        sqlite3.Connection: The connection object to the database.
-    """
-    return sqlite3.connect(DB_NAME)
-
-
-def create_tables(db: sqlite3.Connection) -> None:
-    """
-    Creates the 'book' and 'author' tables in the database if they do
-    not exist.
-
-    Args:
-        db (sqlite3.Connection): The active database connection.
-
-    Returns:
-        None
-    """
-    cursor = db.cursor()
-
-    # TEMP CODE: Only use during setup/testing
-    # cursor.execute('DROP TABLE IF EXISTS book')
-    # cursor.execute('DROP TABLE IF EXISTS author')
-
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS book (
-            id INTEGER PRIMARY KEY,
-            title TEXT,
-            authorID INTEGER,
-            qty INTEGER
-        )
-    ''')
-
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS author (
-            id INTEGER PRIMARY KEY,
-            name TEXT,
-            country TEXT
-        )
-    ''')
-
-    db.commit()
-
-
-def insert_sample_data(db: sqlite3.Connection) -> None:
-    """
-    Inserts sample book and author data into the database.
-
-    Args:
-        db (sqlite3.Connection): The active database connection.
-
-    Returns:
-        None
-    """
-    cursor = db.cursor()
-
-    book_data = [
-        (3001, "A Tale of Two Cities", 1290, 30),
-        (3002, "Harry Potter and the Philosopher's Stone", 8937, 40),
-        (3003, "The Lion, the Witch and the Wardrobe", 2356, 25),
-        (3004, "The Lord of the Rings", 6380, 37),
-        (3005, "Alice's Adventures in Wonderland", 5620, 12)
-    ]
-
-    author_data = [
-        (1290, "Charles Dickens", "England"),
-        (8937, "J.K. Rowling", "England"),
-        (2356, "C.S. Lewis", "Ireland"),
-        (6380, "J.R.R. Tolkien", "South Africa"),
-        (5620, "Lewis Carroll", "England")
-    ]
-
-    cursor.executemany(
-        "INSERT INTO book(id, title, authorID, qty) VALUES (?, ?, ?, ?)",
-        book_data
-    )
-    print("Books added\n")
-
-    cursor.executemany(
-        "INSERT INTO author(id, name, country) VALUES (?, ?, ?)",
-        author_data
-    )
-    print("Authors added\n")
-
-    db.commit()
-
-
-def cancel_operation(user_input: str) -> bool:
-    """
-    Checks if the user wants to cancel the current input operation.
-
-    If the user enters 'x' (in any case), a cancellation message is
-    printed and the function returns True to indicate the process
-    should stop.
-
-    Args:
-        user_input (str): The input entered by the user.
-
-    Returns:
-        bool: True if the user entered 'x' to cancel, otherwise False.
-    """
-    if user_input.lower() == "x":
-        print("Operation cancelled.")
-        return True
-    return False
-
-
-def commit_and_print(db: sqlite3.Connection, message: str) -> None:
-    """
-    Commits changes to the SQLite database and prints a confirmation
-    message.
-
-    This utility function ensures that changes made via SQL queries
-    are saved permanently and informs the user that the operation was
-    successful.
-
-    Args:
-        db (sqlite3.Connection): The active SQLite database connection
-        to commit.
-        message (str): A message to display after committing the
-        changes.
-
-    Returns:
-        None
-    """
-    db.commit()
-    print(message)
-
-
-def add_author(db: sqlite3.Connection) -> None:
-    """
-    Prompts the user to enter and add a new author to the database.
-
-    The function ensures that:
-    - The author ID is unique, numeric, and exactly 4 digits
-    - The author's name and country are not empty (with feedback)
-    - Users can type 'x' at any prompt to cancel the operation
-
-    Args:
-        db (sqlite3.Connection): An active SQLite database connection.
-
-    Returns:
-        None
-    """
-    cursor = db.cursor()
-
-    while True:
-        author_input = input(
-            "Enter new 4-digit author ID or 'x' to cancel: "
-        ).strip()
-        if author_input.lower() == "x":
-            print("Operation cancelled.")
-            return
-
-        if not author_input.isdigit() or len(author_input) != 4:
-            print("Author ID must be a numeric value with exactly 4 digits.\n")
-            continue
-
-        author_id = int(author_input)
-        cursor.execute("SELECT * FROM author WHERE id = ?", (author_id,))
-        if cursor.fetchone():
-            print("An author with that ID already exists. Try another.\n")
-        else:
-            break
-
-    name = input("Enter author name: ").strip().title()
-    if not name:
-        print("Author name cannot be empty.")
-        return
-
-    country = input("Enter author's country: ").strip().title()
-    if not country:
-        print("Author country cannot be empty.")
-        return
-
-    cursor.execute(
-        "INSERT INTO author(id, name, country) VALUES (?, ?, ?)",
-        (author_id, name, country)
-    )
-    commit_and_print(db, "Author added successfully.\n")
-
-
-def add_book_or_author(db: sqlite3.Connection) -> None:
-    """
-    Prompts the user to choose whether to add a new book or a new
-    author.
-
-    If the user selects 'book':
-    - Ensures the book ID is unique, numeric, and exactly 4 digits
-    - Verifies that the provided author ID exists and is exactly 4
-    digits
-    - Validates that title is not empty and quantity is a non-negative
-    integer
-    - Inserts the new book into the 'book' table
-
-    If the user selects 'author':
-    - Calls the add_author() function to handle author creation
-
-    Args:
-        db (sqlite3.Connection): An active SQLite database connection.
-
-    Returns:
-        None
-    """
-    while True:
-        choice = input(
-            "What would you like to add?"
-            " ('Book' or 'Author', or 'x' to cancel): "
-        ).strip().lower()
-        if cancel_operation(choice):
-            return
-
-        if choice == "book":
-            cursor = db.cursor()
-
-            # Get a unique 4-digit book ID
-            while True:
-                book_id_input = input(
-                    "Enter 4-digit book ID or 'x' to cancel: "
-                    ).strip()
-                if cancel_operation(book_id_input):
-                    return
-                if not book_id_input.isdigit() or len(book_id_input) != 4:
-                    print(
-                        "Book ID must be a numeric value with exactly 4"
-                        " digits.\n"
-                    )
-                    continue
-
-                book_id = int(book_id_input)
-                cursor.execute("SELECT * FROM book WHERE id = ?", (book_id,))
-                if cursor.fetchone():
-                    print(
-                        "A book with that ID already exists. Please enter a"
-                        " different ID.\n"
-                    )
-                else:
-                    break
-
-            # Get the book title
-            title = input("Enter book title or 'x' to cancel: ").strip()
-            if cancel_operation(title):
-                return
-            if not title:
-                print("Book title is required.\n")
-                return
-
-            # Get a valid 4-digit author ID
-            while True:
-                author_id_input = input(
-                    "Enter 4-digit author ID or 'x' to cancel: "
-                ).strip()
-                if cancel_operation(author_id_input):
-                    return
-                if not author_id_input.isdigit() or len(author_id_input) != 4:
-                    print(
-                        "Author ID must be a numeric value with exactly 4"
-                        " digits.\n"
-                        )
-                    continue
-
-                author_id = int(author_id_input)
-                cursor.execute("SELECT * FROM author WHERE id = ?",
-                               (author_id,))
-                if cursor.fetchone():
-                    break
-                print(
-                    "No author found with that ID. Please enter a valid"
-                    " author ID.\n"
-                )
-
-            # Get quantity
-            while True:
-                qty_input = input("Enter quantity or 'x' to cancel: ").strip()
-                if cancel_operation(qty_input):
-                    return
-                if not qty_input:
-                    print("Quantity is required.\n")
-                    continue
-                try:
-                    qty = int(qty_input)
-                    if qty >= 0:
-                        break
-                    print("Quantity cannot be negative.\n")
-                except ValueError:
-                    print("Invalid input. Please enter a numeric quantity.\n")
-
-            # Insert the book
-            cursor.execute(
-                '''
-                INSERT INTO book(id, title, authorID, qty)
-                VALUES(?, ?, ?, ?)
-                ''',
-                (book_id, title, author_id, qty)
-            )
-            commit_and_print(db, "Book added successfully.\n")
-            return
-
-        if choice == "author":
-            add_author(db)
-            return
-
-        print(
-            "Invalid input. "
-            "Please type 'book', 'author', or 'x' to cancel.\n"
-        )
-
-
-def update_book(db: sqlite3.Connection) -> None:
-    """
-    Prompts the user to update information for a specific book in the
-    database.
-
-    The user selects a book by ID, and can then choose to update one of
-    the following:
-    - Quantity: Validated as a non-negative integer
-    - Title: Cannot be empty
-    - Author ID: Must refer to an existing author in the 'author' table
-    - Author details: Allows updating the associated author's name and
-      country
-
-    All updates are committed to the database if the inputs are valid.
-
-    Args:
-        db (sqlite3.Connection): An active SQLite database connection.
-
-    Returns:
-        None
-    """
-    cursor = db.cursor()
-
-    # Get valid book ID
-    while True:
-        book_id_input = input(
-            "Enter the ID of the book to update (or 'x' to cancel): "
-        ).strip()
-        if cancel_operation(book_id_input):
-            return
-        if not book_id_input:
-            print("Book ID is required.\n")
-            continue
-
-        if not book_id_input.isdigit() or len(book_id_input) != 4:
-            print("Book ID must be a 4-digit number.\n")
-            continue
-        book_id = int(book_id_input)
-        cursor.execute("SELECT * FROM book WHERE id = ?", (book_id,))
-        book = cursor.fetchone()
-        if book:
-            break
-
-        print("No book found with that ID. Please try again.\n")
-
-    print(
-        f"\nCurrent book details:\nID: {book[0]}\nTitle: {book[1]}\n"
-        f"AuthorID: {book[2]}\nQuantity: {book[3]}\n"
-    )
-
-    # Ask and update field
-    while True:
-        update_choice = input(
-            "What would you like to update?"
-            " (qty/title/authorID/author) "
-            "[default is qty, 'x' to cancel]: "
-        ).strip().lower()
-        if cancel_operation(update_choice):
-            return
-        if update_choice == "":
-            update_choice = "qty"
-
-        if update_choice == "qty":
-            while True:
-                new_qty_input = input(
-                    "Enter new quantity (or 'x' to cancel): "
-                ).strip()
-                if cancel_operation(new_qty_input):
-                    return
-                if not new_qty_input:
-                    print("Quantity is required.\n")
-                    continue
-                try:
-                    new_qty = int(new_qty_input)
-                    if new_qty < 0:
-                        print("Quantity cannot be negative.\n")
-                        continue
-                    cursor.execute(
-                        "UPDATE book SET qty = ? WHERE id = ?",
-                        (new_qty, book_id)
-                    )
-                    commit_and_print(db, "Quantity updated successfully.\n")
-                    return
-                except ValueError:
-                    print("Invalid quantity. Please enter a number.\n")
-
-        elif update_choice == "title":
-            while True:
-                new_title = input(
-                    "Enter new title (or 'x' to cancel): "
-                ).strip()
-                if cancel_operation(new_title):
-                    return
-                if not new_title:
-                    print("Title cannot be empty. Please try again.\n")
-                    continue
-                cursor.execute("UPDATE book SET title = ? WHERE id = ?",
-                               (new_title, book_id))
-                commit_and_print(db, "Title updated successfully.\n")
-                return
-
-        elif update_choice == "authorid":
-            while True:
-                new_author_id_input = input(
-                    "Enter new author ID "
-                    "(must already exist, or 'x' to cancel): "
-                ).strip()
-                if cancel_operation(new_author_id_input):
-                    return
-                if not new_author_id_input:
-                    print("Author ID is required.\n")
-                    continue
-
-                if (
-                    not new_author_id_input.isdigit() or
-                    len(new_author_id_input) != 4
-                ):
-                    print("Author ID must be a 4-digit number.\n")
-                    continue
-                new_author_id = int(new_author_id_input)
-                cursor.execute("SELECT * FROM author WHERE id = ?",
-                               (new_author_id,))
-                if cursor.fetchone():
-                    cursor.execute(
-                        "UPDATE book SET authorID = ? WHERE id = ?",
-                        (new_author_id, book_id)
-                    )
-                    commit_and_print(
-                        db, "Book's author ID updated successfully.\n"
-                    )
-                    return
-
-                print(
-                    "The author ID does not exist."
-                    " Please enter an existing author ID.\n"
-                )
-
-        elif update_choice == "author":
-            cursor.execute("SELECT name, country FROM author WHERE id = ?",
-                           (book[2],))
-            author = cursor.fetchone()
-
-            if author:
-                print(f"\nCurrent Author Name: {author[0]}")
-                print(f"Current Author Country: {author[1]}\n")
-
-                new_name = input(
-                    "Enter new author name (or press Enter to keep current"
-                    ", or 'x' to cancel): "
-                ).strip()
-                if cancel_operation(new_name):
-                    return
-                new_country = input(
-                    "Enter new author country (or press Enter to keep"
-                    " current, or 'x' to cancel): "
-                ).strip()
-                if cancel_operation(new_country):
-                    return
-
-                if new_name == "":
-                    new_name = author[0]
-                if new_country == "":
-                    new_country = author[1]
-
-                cursor.execute(
-                    "UPDATE author SET name = ?, country = ? WHERE id = ?",
-                    (new_name, new_country, book[2])
-                )
-                commit_and_print(
-                    db, "Author information updated successfully.\n"
-                )
-                return
-
-            print("Author not found for this book.\n")
-
-        else:
-            print(
-                "Invalid field. Please choose from: qty, title, authorID,"
-                " or author.\n"
-            )
-
-
-def delete_author(db: sqlite3.Connection) -> None:
-    """
-    Deletes an author from the database after validation and
-    confirmation.
-
-    Prompts the user for an author ID, ensures the author exists, checks
-    if they have any books, and confirms deletion. Cancels the operation
-    if the author has books or the user chooses not to proceed.
-
-    Args:
-        db (sqlite3.Connection): An active SQLite database connection.
-
-    Returns:
-        None
-    """
-    cursor = db.cursor()
-
-    while True:
-        author_id_input = input(
-            "Enter the 4-digit ID of the author to delete (or 'x' to cancel): "
-        ).strip()
-        if cancel_operation(author_id_input):
-            return
-        if not author_id_input:
-            print("Author ID is required.\n")
-            continue
-        if not author_id_input.isdigit() or len(author_id_input) != 4:
-            print("Author ID must be a 4-digit number.\n")
-            continue
-
-        author_id = int(author_id_input)
-        cursor.execute("SELECT * FROM author WHERE id = ?", (author_id,))
-        author = cursor.fetchone()
-        if author:
-            break
-        print("No author found with that ID. Try again.\n")
-
-    # Check for books by this author
-    cursor.execute("SELECT * FROM book WHERE authorID = ?", (author_id,))
-    books = cursor.fetchall()
-    if books:
-        print("This author has books associated with them.")
-        print("Please delete those books first.\n")
-        return
-
-    # Show author info before deletion
-    print(
-        f"\nAuthor selected:\nID: {author[0]}\nName: {author[1]}"
-        f"\nCountry: {author[2]}\n"
-    )
-
-    # Confirm deletion
-    while True:
-        confirm = input(
-            "Delete this author? (yes/no): "
-        ).strip().lower()
-        if cancel_operation(confirm):
-            return
-        if confirm == "yes":
-            cursor.execute("DELETE FROM author WHERE id = ?", (author_id,))
-            commit_and_print(db, "Author deleted successfully.\n")
-            return
-        if confirm == "no":
-            print("Deletion cancelled.\n")
-            return
-
-        print("Please type 'yes' or 'no'.")
-
-
-def delete_book_or_author(db: sqlite3.Connection) -> None:
-    """
-    Allows the user to delete either a book or an author.
-
-    Prompts the user to choose what to delete. If deleting a book,
-    the function validates the book ID, shows details, and confirms
-    deletion. If deleting an author, the delete_author() function is
-    called. Users can cancel at any prompt by entering 'x'.
-
-    Args:
-        db (sqlite3.Connection): An active SQLite database connection.
-
-    Returns:
-        None
-    """
-    cursor = db.cursor()
-
-    while True:
-        choice = input(
-            "What would you like to delete? "
-            "('Book' or 'Author' or 'x' to cancel): "
-        ).strip().lower()
-        if cancel_operation(choice):
-            return
-        if not choice:
-            print("Input cannot be blank.\n")
-            continue
-
-        if choice == "book":
-            while True:
-                book_input = input(
-                    "Enter the 4-digit ID of the book to delete "
-                    "(or 'x' to cancel): "
-                ).strip()
-                if cancel_operation(book_input):
-                    return
-                if not book_input:
-                    print("Book ID is required.\n")
-                    continue
-                if not book_input.isdigit() or len(book_input) != 4:
-                    print("Book ID must be a 4-digit number.\n")
-                    continue
-
-                book_id = int(book_input)
-                cursor.execute("SELECT * FROM book WHERE id = ?",
-                               (book_id,))
-                book = cursor.fetchone()
-                if book:
-                    break
-                print("No book found with that ID.\n")
-
-            # Show book details
-            print(
-                f"\nBook selected:\nID: {book[0]}\nTitle: {book[1]}"
-                f"\nAuthorID: {book[2]}\nQuantity: {book[3]}\n"
-            )
-
-            while True:
-                confirm = input(
-                    "Delete this book? (yes/no): "
-                ).strip().lower()
-                if confirm == "yes":
-                    cursor.execute("DELETE FROM book WHERE id = ?", (book_id,))
-                    commit_and_print(db, "Book deleted successfully.\n")
-                    return
-                if confirm == "no":
-                    print("Deletion cancelled.\n")
-                    return
-
-                print("Please type 'yes' or 'no'.\n")
-
-        elif choice == "author":
-            delete_author(db)
-            return
-        else:
-            print("Invalid option. Choose 'Book' or 'Author'.\n")
-
-
-def search_books(db: sqlite3.Connection) -> None:
-    """
-    Allows the user to search for books by ID or title.
-
-    The user can choose to search by book ID or by a partial/full title.
-    - When searching by ID, the function validates the input and shows
-      the matching book details if found.
-    - When searching by title, it performs a partial match and lists all
-      matching books.
-
-    The user can cancel the search at any prompt by entering 'x'.
-
-    Args:
-        db (sqlite3.Connection): An active SQLite database connection.
-
-    Returns:
-        None
-    """
-    cursor = db.cursor()
-
-    while True:
-        search_by = input(
-            "Search by ID or title? "
-            "(type 'id' or 'title', or 'x' to cancel): "
-        ).strip().lower()
-
-        if cancel_operation(search_by):
-            return
-        if not search_by:
-            print("Input cannot be blank.\n")
-            continue
-
-        if search_by == "id":
-            book_input = input(
-                "Enter the 4-digit book ID (or 'x' to cancel): "
-            ).strip()
-            if cancel_operation(book_input):
-                return
-            if not book_input:
-                print("Book ID is required.\n")
-                continue
-            if not book_input.isdigit() or len(book_input) != 4:
-                print("Book ID must be a 4-digit number.\n")
-                continue
-
-            book_id = int(book_input)
-            cursor.execute("SELECT * FROM book WHERE id = ?", (book_id,))
-            book = cursor.fetchone()
-            if book:
-                print(
-                    f"\nBook found:\nID: {book[0]}\nTitle: {book[1]}"
-                    f"\nAuthorID: {book[2]}\nQuantity: {book[3]}\n"
-                )
-                return
-
-            print("No book found with that ID.\n")
-
-        elif search_by == "title":
-            title = input(
-                "Enter the book title (or part of it, or 'x' to cancel): "
-            ).strip()
-            if cancel_operation(title):
-                return
-            if not title:
-                print("Book title is required.\n")
-                continue
-            cursor.execute("SELECT * FROM book WHERE title LIKE ?",
-                           (f'%{title}%',))
-            books = cursor.fetchall()
-            if books:
-                print("\nBooks found:")
-                for book in books:
-                    print(
-                        f"ID: {book[0]} | Title: {book[1]} | AuthorID: "
-                        f"{book[2]} | Quantity: {book[3]}"
-                    )
-                print()
-                return
-
-            print("No books found matching that title.\n")
-
-        else:
-            print("Invalid option. Please type 'id', 'title', or 'x'.\n")
-
-
-def view_all_books(db: sqlite3.Connection) -> None:
-    """
-    Displays detailed information for all books along with their
-    authors.
-
-    Retrieves and prints the title of each book, the corresponding
-    author's name, and the author's country in a formatted layout.
-
-    Args:
-        db (sqlite3.Connection): An active SQLite database connection.
-
-    Returns:
-        None
-    """
-    print("\nDetails")
-    print("-" * 55)
-
-    cursor = db.cursor()
-
-    cursor.execute(
-        '''
-        SELECT book.title, author.name, author.country
-        FROM book
-        INNER JOIN author ON book.authorID = author.id
-        '''
-    )
-
-    results = cursor.fetchall()
-
-    for title, name, country in results:
-        print(f"Title: {title}")
-        print(f"Author's Name: {name}")
-        print(f"Author's Country: {country}")
-        print("-" * 55)
-
-
-def main_menu(db: sqlite3.Connection) -> None:
-    """
-    Displays the main menu, prompts the user for options,
-    and calls appropriate functions to manage the book and author
-    database.
-
-    Args:
-        db (sqlite3.Connection): An active SQLite database connection.
-
-    Returns:
-        None
-    """
-    while True:
-        menu = input(
-            '''Select one of the following options:
-    1 - add book/author
-    2 - update book
-    3 - delete book/author
-    4 - search books
-    5 - view details of all books
-    0 - exit
-    : '''
-        ).strip()
-
-        if menu == "1":
-            add_book_or_author(db)
-        elif menu == "2":
-            update_book(db)
-        elif menu == "3":
-            delete_book_or_author(db)
-        elif menu == "4":
-            search_books(db)
-        elif menu == "5":
-            view_all_books(db)
-        elif menu == "0":
-            print('Goodbye!!!')
-            break
-        else:
-            print("Invalid option.")
-
-
-with connect_db() as db:
-    create_tables(db)
-    insert_sample_data(db)
-
-    main_menu(db)
+"""
+Book and Author Management System
+
+This program manages a book inventory and author database using SQLite.
+Users can:
+- Add new books or authors (with ID validation)
+- Update book details (quantity, title, or author ID)
+- Delete books or authors (with checks for related records)
+- Search for books and view all book records
+
+The system ensures that author IDs in books match existing authors and
+prevents accidental data loss.
+"""
+import re
+import sqlite3
+from contextlib import contextmanager
+from functools import lru_cache
+from sys import intern
+from typing import Callable, Optional, Tuple
+
+try:
+    # Importing readline is enough to give every input() prompt line
+    # editing and history; not available on all platforms.
+    import readline  # noqa: F401
+except ImportError:
+    pass
+
+DB_NAME = "ebookstore.db"
+
+# Book and author IDs are exactly four digits; the compiled pattern
+# does the digit-and-length test in one C-level match.
+ID_PATTERN = re.compile(r"\A\d{4}\Z")
+
+# Inputs that cancel the current operation; a frozenset membership
+# test avoids lowering (and allocating) a new string on every prompt.
+CANCEL_INPUTS = frozenset(("x", "X"))
+
+# Interned choice keywords: comparing cleaned input against interned
+# strings lets equality short-circuit on pointer identity for the
+# common exact-match case.
+CHOICE_BOOK = intern("book")
+CHOICE_AUTHOR = intern("author")
+CHOICE_AUTHOR_ID = intern("authorid")
+CHOICE_QTY = intern("qty")
+CHOICE_TITLE = intern("title")
+CHOICE_ID = intern("id")
+CHOICE_YES = intern("yes")
+CHOICE_NO = intern("no")
+
+# Precompiled SQL shared by the menu handlers. Routing every query
+# through Connection.execute() with these exact strings lets sqlite3's
+# statement cache reuse the prepared statements instead of re-parsing
+# the same SQL on each pass through a prompt loop.
+SQL_BOOK_BY_ID = "SELECT id, title, authorID, qty FROM book WHERE id = ?"
+SQL_BOOK_WITH_AUTHOR = (
+    "SELECT b.id, b.title, b.authorID, b.qty, a.name, a.country "
+    "FROM book b LEFT JOIN author a ON a.id = b.authorID "
+    "WHERE b.id = ?"
+)
+SQL_AUTHOR_BY_ID = "SELECT id, name, country FROM author WHERE id = ?"
+SQL_BOOK_EXISTS = "SELECT 1 FROM book WHERE id = ? LIMIT 1"
+SQL_AUTHOR_EXISTS = "SELECT 1 FROM author WHERE id = ? LIMIT 1"
+SQL_BOOKS_BY_TITLE = (
+    "SELECT id, title, authorID, qty FROM book WHERE title LIKE ?"
+)
+SQL_BOOKS_FTS = (
+    "SELECT b.id, b.title, b.authorID, b.qty "
+    "FROM book_fts f JOIN book b ON b.id = f.rowid "
+    "WHERE book_fts MATCH ?"
+)
+SQL_INSERT_BOOK = (
+    "INSERT INTO book(id, title, authorID, qty) VALUES (?, ?, ?, ?)"
+)
+SQL_INSERT_AUTHOR = "INSERT INTO author(id, name, country) VALUES (?, ?, ?)"
+SQL_UPDATE_QTY = "UPDATE book SET qty = ? WHERE id = ? RETURNING qty"
+SQL_UPDATE_TITLE = "UPDATE book SET title = ? WHERE id = ?"
+SQL_UPDATE_BOOK_AUTHOR = "UPDATE book SET authorID = ? WHERE id = ?"
+SQL_UPDATE_AUTHOR = (
+    "UPDATE author SET name = ?, country = ? WHERE id = ? "
+    "RETURNING name, country"
+)
+SQL_DELETE_BOOK = "DELETE FROM book WHERE id = ? RETURNING id"
+SQL_DELETE_AUTHOR = "DELETE FROM author WHERE id = ? RETURNING id"
+
+# DDL fragments shared by create_tables() and the legacy-schema
+# migration, which has to recreate the book table and the structures
+# that drop along with it.
+BOOK_TABLE_COLUMNS = '''
+            id INTEGER PRIMARY KEY,
+            title TEXT,
+            authorID INTEGER,
+            qty INTEGER,
+            FOREIGN KEY (authorID) REFERENCES author (id)
+                ON DELETE RESTRICT
+'''
+BOOK_SUPPORT_DDL = '''
+        CREATE INDEX IF NOT EXISTS ix_book_authorid ON book(authorID);
+
+        CREATE TRIGGER IF NOT EXISTS book_fts_insert
+        AFTER INSERT ON book BEGIN
+            INSERT INTO book_fts(rowid, title) VALUES (new.id, new.title);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS book_fts_delete
+        AFTER DELETE ON book BEGIN
+            INSERT INTO book_fts(book_fts, rowid, title)
+            VALUES ('delete', old.id, old.title);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS book_fts_update
+        AFTER UPDATE OF title ON book BEGIN
+            INSERT INTO book_fts(book_fts, rowid, title)
+            VALUES ('delete', old.id, old.title);
+            INSERT INTO book_fts(rowid, title) VALUES (new.id, new.title);
+        END;
+'''
+
+
+def connect_db() -> sqlite3.Connection:
+    """
+    Establishes and returns a connection to the SQLite database.
+
+    The connection is tuned for this workload of many small write
+    transactions:
+    - WAL journal mode (skipped for in-memory databases) so writers do
+      not block readers and commits need fewer fsyncs
+    - synchronous=NORMAL, which is safe in WAL mode
+    - an in-memory temp store and a larger page cache
+    - a busy timeout so concurrent access waits instead of failing
+
+    The connection runs in autocommit mode (isolation_level=None);
+    multi-statement workflows group their writes explicitly with the
+    tx() context manager instead of relying on the driver's implicit
+    BEGIN/COMMIT state machine.
+
+    Returns:
+        sqlite3.Connection: The connection object to the database.
+    """
+    db = sqlite3.connect(DB_NAME, isolation_level=None,
+                         cached_statements=128)
+    if DB_NAME != ":memory:":
+        db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("PRAGMA temp_store=MEMORY")
+    db.execute("PRAGMA cache_size=-64000")
+    db.execute("PRAGMA busy_timeout=30000")
+    db.execute("PRAGMA foreign_keys=ON")
+    return db
+
+
+def create_tables(db: sqlite3.Connection) -> None:
+    """
+    Creates the 'book' and 'author' tables in the database if they do
+    not exist.
+
+    The book table carries a foreign key to author with ON DELETE
+    RESTRICT, so referential integrity is enforced by SQLite itself.
+    Also creates an index on book.authorID so the author/book
+    cross-checks and the view-all join avoid full table scans, plus a
+    'book_fts' full-text index on titles (kept in sync by triggers)
+    used by the title search.
+
+    Args:
+        db (sqlite3.Connection): The active database connection.
+
+    Returns:
+        None
+    """
+    # book_fts reads through to book (content='book'), so querying it
+    # cannot tell whether the index itself is empty. Note before the
+    # DDL runs whether the table already existed; if it is newly
+    # created, any pre-existing book rows need a backfill.
+    fts_existed = db.execute(
+        "SELECT 1 FROM sqlite_master"
+        " WHERE type = 'table' AND name = 'book_fts'"
+    ).fetchone() is not None
+
+    # One executescript() call runs the whole DDL batch through SQLite
+    # in a single round-trip instead of one execute() per statement.
+    db.executescript(f'''
+        CREATE TABLE IF NOT EXISTS author (
+            id INTEGER PRIMARY KEY,
+            name TEXT,
+            country TEXT
+        );
+
+        CREATE TABLE IF NOT EXISTS book ({BOOK_TABLE_COLUMNS});
+
+        CREATE VIRTUAL TABLE IF NOT EXISTS book_fts USING fts5(
+            title, content='book', content_rowid='id'
+        );
+        {BOOK_SUPPORT_DDL}
+    ''')
+
+    migrate_legacy_book_table(db)
+
+    # Backfill the full-text index for databases created before it
+    # existed (the triggers only cover rows written from now on); a
+    # rebuild on a brand-new empty database is a no-op.
+    if not fts_existed:
+        db.execute("INSERT INTO book_fts(book_fts) VALUES ('rebuild')")
+
+
+def migrate_legacy_book_table(db: sqlite3.Connection) -> None:
+    """
+    Rebuilds the book table with its foreign key on legacy databases.
+
+    CREATE TABLE IF NOT EXISTS leaves databases created before the
+    foreign key existed with their original unconstrained book table,
+    which would silently skip the referential-integrity enforcement
+    the handlers rely on. When PRAGMA foreign_key_list shows no
+    constraint, the table is swapped for one carrying the foreign key
+    and the index and FTS triggers dropped with the old table are
+    recreated.
+
+    Args:
+        db (sqlite3.Connection): The active database connection.
+
+    Returns:
+        None
+    """
+    if db.execute("PRAGMA foreign_key_list(book)").fetchone() is not None:
+        return
+
+    # Enforcement stays off while rows are copied: legacy data may
+    # hold dangling author IDs, which are preserved and only become
+    # subject to the constraint on their next write.
+    db.execute("PRAGMA foreign_keys=OFF")
+    try:
+        db.executescript(f'''
+            BEGIN;
+
+            CREATE TABLE book_migrated ({BOOK_TABLE_COLUMNS});
+
+            INSERT INTO book_migrated
+            SELECT id, title, authorID, qty FROM book;
+
+            DROP TABLE book;
+
+            ALTER TABLE book_migrated RENAME TO book;
+            {BOOK_SUPPORT_DDL}
+            COMMIT;
+        ''')
+    finally:
+        db.execute("PRAGMA foreign_keys=ON")
+
+
+def insert_sample_data(db: sqlite3.Connection) -> None:
+    """
+    Inserts sample book and author data into the database.
+
+    Seeding only runs once: if the 'book' table already holds rows the
+    function returns immediately, so restarting the program does not
+    raise duplicate-key errors. Both batches are written inside a
+    single transaction so the bulk load costs one commit instead of
+    one per statement.
+
+    Args:
+        db (sqlite3.Connection): The active database connection.
+
+    Returns:
+        None
+    """
+    if db.execute("SELECT 1 FROM book LIMIT 1").fetchone():
+        return
+
+    book_data = [
+        (3001, "A Tale of Two Cities", 1290, 30),
+        (3002, "Harry Potter and the Philosopher's Stone", 8937, 40),
+        (3003, "The Lion, the Witch and the Wardrobe", 2356, 25),
+        (3004, "The Lord of the Rings", 6380, 37),
+        (3005, "Alice's Adventures in Wonderland", 5620, 12)
+    ]
+
+    author_data = [
+        (1290, "Charles Dickens", "England"),
+        (8937, "J.K. Rowling", "England"),
+        (2356, "C.S. Lewis", "Ireland"),
+        (6380, "J.R.R. Tolkien", "South Africa"),
+        (5620, "Lewis Carroll", "England")
+    ]
+
+    # Authors go in first so the books' foreign keys resolve.
+    with tx(db):
+        db.executemany(SQL_INSERT_AUTHOR, author_data)
+        db.executemany(SQL_INSERT_BOOK, book_data)
+
+    print("Books added\n")
+    print("Authors added\n")
+
+
+@contextmanager
+def tx(db: sqlite3.Connection):
+    """
+    Groups a block of statements into one explicit transaction.
+
+    Begins an immediate transaction, commits it when the block exits
+    normally, and rolls it back if the block raises. Batching writes
+    this way costs a single commit (and fsync) for the whole block
+    instead of one per statement.
+
+    Args:
+        db (sqlite3.Connection): The active database connection.
+
+    Yields:
+        None
+    """
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+        db.execute("COMMIT")
+    except Exception:
+        db.execute("ROLLBACK")
+        raise
+
+
+def valid_id(user_input: str) -> bool:
+    """
+    Checks whether the given input is a valid 4-digit ID.
+
+    Args:
+        user_input (str): The input entered by the user.
+
+    Returns:
+        bool: True if the input is exactly four digits, otherwise
+        False.
+    """
+    return ID_PATTERN.match(user_input) is not None
+
+
+@lru_cache(maxsize=1024)
+def author_info(
+    db: sqlite3.Connection, author_id: int
+) -> Optional[Tuple[int, str, str]]:
+    """
+    Looks up an author row, serving repeats from an in-process cache.
+
+    Repeated lookups for the same author (common when browsing a
+    catalog where many books share an author) become a dict hit
+    instead of a B-tree probe. Any code that inserts, updates, or
+    deletes author rows must call author_info.cache_clear() afterwards
+    so stale entries are dropped.
+
+    Args:
+        db (sqlite3.Connection): The active database connection.
+        author_id (int): The author's 4-digit ID.
+
+    Returns:
+        Optional[Tuple[int, str, str]]: The (id, name, country) row,
+        or None if no such author exists.
+    """
+    return db.execute(SQL_AUTHOR_BY_ID, (author_id,)).fetchone()
+
+
+def cancel_operation(user_input: str) -> bool:
+    """
+    Checks if the user wants to cancel the current input operation.
+
+    If the user enters 'x' (in any case), a cancellation message is
+    printed and the function returns True to indicate the process
+    should stop.
+
+    Args:
+        user_input (str): The input entered by the user.
+
+    Returns:
+        bool: True if the user entered 'x' to cancel, otherwise False.
+    """
+    if user_input in CANCEL_INPUTS:
+        print("Operation cancelled.")
+        return True
+    return False
+
+
+def prompt_validated(
+    prompt: str,
+    ok: Callable[[str], bool],
+    err: str,
+) -> Optional[str]:
+    """
+    Prompts the user until the input passes validation or is cancelled.
+
+    The entered text is stripped before checking. Entering 'x' (in any
+    case) cancels the operation and returns None; invalid input prints
+    the supplied error message and asks again.
+
+    Args:
+        prompt (str): The text shown when asking for input.
+        ok (Callable[[str], bool]): Returns True when the input is
+        acceptable.
+        err (str): The message printed when validation fails.
+
+    Returns:
+        Optional[str]: The validated input, or None if cancelled.
+    """
+    while True:
+        user_input = input(prompt).strip()
+        if cancel_operation(user_input):
+            return None
+        if ok(user_input):
+            return user_input
+        print(err)
+
+
+def commit_and_print(db: sqlite3.Connection, message: str) -> None:
+    """
+    Prints a confirmation message after a committed write.
+
+    Committing is handled by the tx() block (or autocommit) around the
+    write itself, so this helper only reports the outcome. The name
+    and signature are kept so call sites read the same as before.
+
+    Args:
+        db (sqlite3.Connection): The active SQLite database connection
+        the write ran on.
+        message (str): A message to display after the changes.
+
+    Returns:
+        None
+    """
+    print(message)
+
+
+def add_author(db: sqlite3.Connection) -> None:
+    """
+    Prompts the user to enter and add a new author to the database.
+
+    The function ensures that:
+    - The author ID is unique, numeric, and exactly 4 digits
+    - The author's name and country are not empty (with feedback)
+    - Users can type 'x' at any prompt to cancel the operation
+
+    Args:
+        db (sqlite3.Connection): An active SQLite database connection.
+
+    Returns:
+        None
+    """
+    while True:
+        author_input = prompt_validated(
+            "Enter new 4-digit author ID or 'x' to cancel: ",
+            valid_id,
+            "Author ID must be a numeric value with exactly 4 digits.\n"
+        )
+        if author_input is None:
+            return
+
+        author_id = int(author_input)
+        if db.execute(SQL_AUTHOR_EXISTS, (author_id,)).fetchone() is not None:
+            print("An author with that ID already exists. Try another.\n")
+        else:
+            break
+
+    name = input("Enter author name: ").strip().title()
+    if not name:
+        print("Author name cannot be empty.")
+        return
+
+    country = input("Enter author's country: ").strip().title()
+    if not country:
+        print("Author country cannot be empty.")
+        return
+
+    with tx(db):
+        db.execute(SQL_INSERT_AUTHOR, (author_id, name, country))
+    author_info.cache_clear()
+    commit_and_print(db, "Author added successfully.\n")
+
+
+def add_book_or_author(db: sqlite3.Connection) -> None:
+    """
+    Prompts the user to choose whether to add a new book or a new
+    author.
+
+    If the user selects 'book':
+    - Ensures the book ID is unique, numeric, and exactly 4 digits
+    - Verifies that the provided author ID exists and is exactly 4
+    digits
+    - Validates that title is not empty and quantity is a non-negative
+    integer
+    - Inserts the new book into the 'book' table
+
+    If the user selects 'author':
+    - Calls the add_author() function to handle author creation
+
+    Args:
+        db (sqlite3.Connection): An active SQLite database connection.
+
+    Returns:
+        None
+    """
+    # Local bindings keep the per-iteration method lookups out of the
+    # retry loop.
+    _strip = str.strip
+    _lower = str.lower
+
+    while True:
+        choice = _lower(_strip(input(
+            "What would you like to add?"
+            " ('Book' or 'Author', or 'x' to cancel): "
+        )))
+        if cancel_operation(choice):
+            return
+
+        if choice == CHOICE_BOOK:
+            # Get a unique 4-digit book ID
+            while True:
+                book_id_input = prompt_validated(
+                    "Enter 4-digit book ID or 'x' to cancel: ",
+                    valid_id,
+                    "Book ID must be a numeric value with exactly 4"
+                    " digits.\n"
+                )
+                if book_id_input is None:
+                    return
+
+                book_id = int(book_id_input)
+                if db.execute(SQL_BOOK_EXISTS,
+                              (book_id,)).fetchone() is not None:
+                    print(
+                        "A book with that ID already exists. Please enter a"
+                        " different ID.\n"
+                    )
+                else:
+                    break
+
+            # Get the book title
+            title = input("Enter book title or 'x' to cancel: ").strip()
+            if cancel_operation(title):
+                return
+            if not title:
+                print("Book title is required.\n")
+                return
+
+            # Get quantity
+            while True:
+                qty_input = input("Enter quantity or 'x' to cancel: ").strip()
+                if cancel_operation(qty_input):
+                    return
+                if not qty_input:
+                    print("Quantity is required.\n")
+                    continue
+                try:
+                    qty = int(qty_input)
+                    if qty >= 0:
+                        break
+                    print("Quantity cannot be negative.\n")
+                except ValueError:
+                    print("Invalid input. Please enter a numeric quantity.\n")
+
+            # Get a 4-digit author ID and insert the book. The foreign
+            # key constraint enforces that the author exists, so the
+            # insert doubles as the existence check.
+            while True:
+                author_id_input = prompt_validated(
+                    "Enter 4-digit author ID or 'x' to cancel: ",
+                    valid_id,
+                    "Author ID must be a numeric value with exactly 4"
+                    " digits.\n"
+                )
+                if author_id_input is None:
+                    return
+
+                author_id = int(author_id_input)
+                try:
+                    with tx(db):
+                        db.execute(SQL_INSERT_BOOK,
+                                   (book_id, title, author_id, qty))
+                except sqlite3.IntegrityError:
+                    print(
+                        "No author found with that ID. Please enter a valid"
+                        " author ID.\n"
+                    )
+                    continue
+                commit_and_print(db, "Book added successfully.\n")
+                return
+
+        if choice == CHOICE_AUTHOR:
+            add_author(db)
+            return
+
+        print(
+            "Invalid input. "
+            "Please type 'book', 'author', or 'x' to cancel.\n"
+        )
+
+
+def update_book(db: sqlite3.Connection) -> None:
+    """
+    Prompts the user to update information for a specific book in the
+    database.
+
+    The user selects a book by ID, and can then choose to update one of
+    the following:
+    - Quantity: Validated as a non-negative integer
+    - Title: Cannot be empty
+    - Author ID: Must refer to an existing author in the 'author' table
+    - Author details: Allows updating the associated author's name and
+      country
+
+    All updates are committed to the database if the inputs are valid.
+
+    Args:
+        db (sqlite3.Connection): An active SQLite database connection.
+
+    Returns:
+        None
+    """
+    # Get valid book ID
+    while True:
+        book_id_input = prompt_validated(
+            "Enter the ID of the book to update (or 'x' to cancel): ",
+            valid_id,
+            "Book ID must be a 4-digit number.\n"
+        )
+        if book_id_input is None:
+            return
+
+        book_id = int(book_id_input)
+        book = db.execute(SQL_BOOK_WITH_AUTHOR, (book_id,)).fetchone()
+        if book:
+            break
+
+        print("No book found with that ID. Please try again.\n")
+
+    print(
+        f"\nCurrent book details:\nID: {book[0]}\nTitle: {book[1]}\n"
+        f"AuthorID: {book[2]}\nQuantity: {book[3]}\n"
+    )
+
+    # Ask and update field
+    _strip = str.strip
+    _lower = str.lower
+    while True:
+        update_choice = _lower(_strip(input(
+            "What would you like to update?"
+            " (qty/title/authorID/author) "
+            "[default is qty, 'x' to cancel]: "
+        )))
+        if cancel_operation(update_choice):
+            return
+        if update_choice == "":
+            update_choice = "qty"
+
+        if update_choice == CHOICE_QTY:
+            while True:
+                new_qty_input = input(
+                    "Enter new quantity (or 'x' to cancel): "
+                ).strip()
+                if cancel_operation(new_qty_input):
+                    return
+                if not new_qty_input:
+                    print("Quantity is required.\n")
+                    continue
+                try:
+                    new_qty = int(new_qty_input)
+                    if new_qty < 0:
+                        print("Quantity cannot be negative.\n")
+                        continue
+                    # RETURNING confirms the row was written without a
+                    # separate follow-up read.
+                    with tx(db):
+                        updated = db.execute(
+                            SQL_UPDATE_QTY, (new_qty, book_id)
+                        ).fetchall()
+                    if updated:
+                        commit_and_print(
+                            db, "Quantity updated successfully.\n"
+                        )
+                    else:
+                        print("No book found with that ID.\n")
+                    return
+                except ValueError:
+                    print("Invalid quantity. Please enter a number.\n")
+
+        elif update_choice == CHOICE_TITLE:
+            while True:
+                new_title = input(
+                    "Enter new title (or 'x' to cancel): "
+                ).strip()
+                if cancel_operation(new_title):
+                    return
+                if not new_title:
+                    print("Title cannot be empty. Please try again.\n")
+                    continue
+                with tx(db):
+                    db.execute(SQL_UPDATE_TITLE, (new_title, book_id))
+                commit_and_print(db, "Title updated successfully.\n")
+                return
+
+        elif update_choice == CHOICE_AUTHOR_ID:
+            while True:
+                new_author_id_input = prompt_validated(
+                    "Enter new author ID "
+                    "(must already exist, or 'x' to cancel): ",
+                    valid_id,
+                    "Author ID must be a 4-digit number.\n"
+                )
+                if new_author_id_input is None:
+                    return
+
+                new_author_id = int(new_author_id_input)
+                # The foreign key rejects author IDs that do not
+                # exist, so no separate existence probe is needed.
+                try:
+                    with tx(db):
+                        db.execute(SQL_UPDATE_BOOK_AUTHOR,
+                                   (new_author_id, book_id))
+                except sqlite3.IntegrityError:
+                    print(
+                        "The author ID does not exist."
+                        " Please enter an existing author ID.\n"
+                    )
+                    continue
+                commit_and_print(
+                    db, "Book's author ID updated successfully.\n"
+                )
+                return
+
+        elif update_choice == CHOICE_AUTHOR:
+            # The author's name and country were fetched alongside the
+            # book row, so no extra lookup is needed here.
+            if book[4] is not None:
+                print(f"\nCurrent Author Name: {book[4]}")
+                print(f"Current Author Country: {book[5]}\n")
+
+                new_name = input(
+                    "Enter new author name (or press Enter to keep current"
+                    ", or 'x' to cancel): "
+                ).strip()
+                if cancel_operation(new_name):
+                    return
+                new_country = input(
+                    "Enter new author country (or press Enter to keep"
+                    " current, or 'x' to cancel): "
+                ).strip()
+                if cancel_operation(new_country):
+                    return
+
+                if new_name == "":
+                    new_name = book[4]
+                if new_country == "":
+                    new_country = book[5]
+
+                # RETURNING confirms the write hit an existing row in
+                # the same round-trip as the update itself.
+                with tx(db):
+                    updated = db.execute(
+                        SQL_UPDATE_AUTHOR, (new_name, new_country, book[2])
+                    ).fetchall()
+                author_info.cache_clear()
+                if updated:
+                    commit_and_print(
+                        db, "Author information updated successfully.\n"
+                    )
+                    return
+
+            print("Author not found for this book.\n")
+
+        else:
+            print(
+                "Invalid field. Please choose from: qty, title, authorID,"
+                " or author.\n"
+            )
+
+
+def delete_author(db: sqlite3.Connection) -> None:
+    """
+    Deletes an author from the database after validation and
+    confirmation.
+
+    Prompts the user for an author ID, ensures the author exists, checks
+    if they have any books, and confirms deletion. Cancels the operation
+    if the author has books or the user chooses not to proceed.
+
+    Args:
+        db (sqlite3.Connection): An active SQLite database connection.
+
+    Returns:
+        None
+    """
+    while True:
+        author_id_input = prompt_validated(
+            "Enter the 4-digit ID of the author to delete"
+            " (or 'x' to cancel): ",
+            valid_id,
+            "Author ID must be a 4-digit number.\n"
+        )
+        if author_id_input is None:
+            return
+
+        author_id = int(author_id_input)
+        author = db.execute(SQL_AUTHOR_BY_ID, (author_id,)).fetchone()
+        if author:
+            break
+        print("No author found with that ID. Try again.\n")
+
+    # Show author info before deletion
+    print(
+        f"\nAuthor selected:\nID: {author[0]}\nName: {author[1]}"
+        f"\nCountry: {author[2]}\n"
+    )
+
+    # Confirm deletion
+    _strip = str.strip
+    _lower = str.lower
+    while True:
+        confirm = _lower(_strip(input(
+            "Delete this author? (yes/no): "
+        )))
+        if cancel_operation(confirm):
+            return
+        if confirm == CHOICE_YES:
+            # ON DELETE RESTRICT blocks deleting an author who still
+            # has books, replacing the old application-side scan.
+            try:
+                with tx(db):
+                    deleted = db.execute(
+                        SQL_DELETE_AUTHOR, (author_id,)
+                    ).fetchall()
+            except sqlite3.IntegrityError:
+                print("This author has books associated with them.")
+                print("Please delete those books first.\n")
+                return
+            author_info.cache_clear()
+            if deleted:
+                commit_and_print(db, "Author deleted successfully.\n")
+            else:
+                print("No author found with that ID.\n")
+            return
+        if confirm == CHOICE_NO:
+            print("Deletion cancelled.\n")
+            return
+
+        print("Please type 'yes' or 'no'.")
+
+
+def delete_book_or_author(db: sqlite3.Connection) -> None:
+    """
+    Allows the user to delete either a book or an author.
+
+    Prompts the user to choose what to delete. If deleting a book,
+    the function validates the book ID, shows details, and confirms
+    deletion. If deleting an author, the delete_author() function is
+    called. Users can cancel at any prompt by entering 'x'.
+
+    Args:
+        db (sqlite3.Connection): An active SQLite database connection.
+
+    Returns:
+        None
+    """
+    _strip = str.strip
+    _lower = str.lower
+
+    while True:
+        choice = _lower(_strip(input(
+            "What would you like to delete? "
+            "('Book' or 'Author' or 'x' to cancel): "
+        )))
+        if cancel_operation(choice):
+            return
+        if not choice:
+            print("Input cannot be blank.\n")
+            continue
+
+        if choice == CHOICE_BOOK:
+            while True:
+                book_input = prompt_validated(
+                    "Enter the 4-digit ID of the book to delete "
+                    "(or 'x' to cancel): ",
+                    valid_id,
+                    "Book ID must be a 4-digit number.\n"
+                )
+                if book_input is None:
+                    return
+
+                book_id = int(book_input)
+                book = db.execute(SQL_BOOK_BY_ID, (book_id,)).fetchone()
+                if book:
+                    break
+                print("No book found with that ID.\n")
+
+            # Show book details
+            print(
+                f"\nBook selected:\nID: {book[0]}\nTitle: {book[1]}"
+                f"\nAuthorID: {book[2]}\nQuantity: {book[3]}\n"
+            )
+
+            while True:
+                confirm = _lower(_strip(input(
+                    "Delete this book? (yes/no): "
+                )))
+                if confirm == CHOICE_YES:
+                    with tx(db):
+                        deleted = db.execute(
+                            SQL_DELETE_BOOK, (book_id,)
+                        ).fetchall()
+                    if deleted:
+                        commit_and_print(db, "Book deleted successfully.\n")
+                    else:
+                        print("No book found with that ID.\n")
+                    return
+                if confirm == CHOICE_NO:
+                    print("Deletion cancelled.\n")
+                    return
+
+                print("Please type 'yes' or 'no'.\n")
+
+        elif choice == CHOICE_AUTHOR:
+            delete_author(db)
+            return
+        else:
+            print("Invalid option. Choose 'Book' or 'Author'.\n")
+
+
+def search_books(db: sqlite3.Connection) -> None:
+    """
+    Allows the user to search for books by ID or title.
+
+    The user can choose to search by book ID or by a partial/full title.
+    - When searching by ID, the function validates the input and shows
+      the matching book details if found.
+    - When searching by title, it performs a partial match and lists all
+      matching books.
+
+    The user can cancel the search at any prompt by entering 'x'.
+
+    Args:
+        db (sqlite3.Connection): An active SQLite database connection.
+
+    Returns:
+        None
+    """
+    _strip = str.strip
+    _lower = str.lower
+
+    while True:
+        search_by = _lower(_strip(input(
+            "Search by ID or title? "
+            "(type 'id' or 'title', or 'x' to cancel): "
+        )))
+
+        if cancel_operation(search_by):
+            return
+        if not search_by:
+            print("Input cannot be blank.\n")
+            continue
+
+        if search_by == CHOICE_ID:
+            book_input = prompt_validated(
+                "Enter the 4-digit book ID (or 'x' to cancel): ",
+                valid_id,
+                "Book ID must be a 4-digit number.\n"
+            )
+            if book_input is None:
+                return
+
+            book_id = int(book_input)
+            book = db.execute(SQL_BOOK_BY_ID, (book_id,)).fetchone()
+            if book:
+                print(
+                    f"\nBook found:\nID: {book[0]}\nTitle: {book[1]}"
+                    f"\nAuthorID: {book[2]}\nQuantity: {book[3]}\n"
+                )
+                return
+
+            print("No book found with that ID.\n")
+
+        elif search_by == CHOICE_TITLE:
+            title = input(
+                "Enter the book title (or part of it, or 'x' to cancel): "
+            ).strip()
+            if cancel_operation(title):
+                return
+            if not title:
+                print("Book title is required.\n")
+                continue
+            if len(title) >= 2:
+                # Phrase-prefix query against the full-text index;
+                # quotes are doubled so user input cannot break the
+                # MATCH syntax.
+                match = '"{}"*'.format(title.replace('"', '""'))
+                books = db.execute(SQL_BOOKS_FTS, (match,)).fetchall()
+                if not books:
+                    # MATCH only sees token prefixes, so an infix term
+                    # like 'otter' finds nothing there; fall back to
+                    # the LIKE scan before reporting no matches.
+                    books = db.execute(SQL_BOOKS_BY_TITLE,
+                                       (f'%{title}%',)).fetchall()
+            else:
+                # Terms this short are cheaper as a plain LIKE scan.
+                books = db.execute(SQL_BOOKS_BY_TITLE,
+                                   (f'%{title}%',)).fetchall()
+            if books:
+                print("\nBooks found:")
+                for book in books:
+                    print(
+                        f"ID: {book[0]} | Title: {book[1]} | AuthorID: "
+                        f"{book[2]} | Quantity: {book[3]}"
+                    )
+                print()
+                return
+
+            print("No books found matching that title.\n")
+
+        else:
+            print("Invalid option. Please type 'id', 'title', or 'x'.\n")
+
+
+def view_all_books(db: sqlite3.Connection) -> None:
+    """
+    Displays detailed information for all books along with their
+    authors.
+
+    Retrieves and prints the title of each book, the corresponding
+    author's name, and the author's country in a formatted layout.
+
+    Args:
+        db (sqlite3.Connection): An active SQLite database connection.
+
+    Returns:
+        None
+    """
+    print("\nDetails")
+    print("-" * 55)
+
+    cursor = db.execute("SELECT title, authorID FROM book")
+    cursor.arraysize = 256
+
+    # Iterate the cursor directly rather than fetchall() so rows are
+    # printed as SQLite produces them instead of being materialized
+    # into one big list first. Author details come from the LRU cache,
+    # so books sharing an author only hit the author table once.
+    for title, author_id in cursor:
+        author = author_info(db, author_id)
+        if author is None:
+            continue
+        print(f"Title: {title}")
+        print(f"Author's Name: {author[1]}")
+        print(f"Author's Country: {author[2]}")
+        print("-" * 55)
+
+
+def main_menu(db: sqlite3.Connection) -> None:
+    """
+    Displays the main menu, prompts the user for options,
+    and calls appropriate functions to manage the book and author
+    database.
+
+    Args:
+        db (sqlite3.Connection): An active SQLite database connection.
+
+    Returns:
+        None
+    """
+    _strip = str.strip
+
+    while True:
+        menu = _strip(input(
+            '''Select one of the following options:
+    1 - add book/author
+    2 - update book
+    3 - delete book/author
+    4 - search books
+    5 - view details of all books
+    0 - exit
+    : '''
+        ))
+
+        if menu == "1":
+            add_book_or_author(db)
+        elif menu == "2":
+            update_book(db)
+        elif menu == "3":
+            delete_book_or_author(db)
+        elif menu == "4":
+            search_books(db)
+        elif menu == "5":
+            view_all_books(db)
+        elif menu == "0":
+            print('Goodbye!!!')
+            break
+        else:
+            print("Invalid option.")
+
+
+if __name__ == "__main__":
+    with connect_db() as db:
+        create_tables(db)
+        insert_sample_data(db)
+
+        main_menu(db)